@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -306,8 +307,19 @@ def main():
     """
     try:
         # Load data
-        sales_data = pd.read_csv('daily_sales_processed.csv', parse_dates=['date'])
-        forecast_data = pd.read_csv('forecast_data.csv', parse_dates=['date'])
+        # time_series_analysis writes the daily series as Parquet by
+        # default now; the CSV only exists behind its --csv flag
+        if os.path.exists('daily_sales_processed.parquet'):
+            sales_data = (pd.read_parquet('daily_sales_processed.parquet')
+                          .rename_axis('date').reset_index())
+        else:
+            sales_data = pd.read_csv('daily_sales_processed.csv', parse_dates=['date'])
+        # sales_forecasting writes the forecast as Parquet now; keep the
+        # CSV path for forecasts produced by older runs
+        if os.path.exists('forecast_data.parquet'):
+            forecast_data = pd.read_parquet('forecast_data.parquet').reset_index()
+        else:
+            forecast_data = pd.read_csv('forecast_data.csv', parse_dates=['date'])
         
         # Create analyzer
         analyzer = BusinessOpportunityAnalyzer(sales_data, forecast_data)
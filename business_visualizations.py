@@ -194,7 +194,8 @@ def main():
     """
     try:
         # Check if data files exist, if not create sample data
-        if not os.path.exists('daily_sales_processed.csv'):
+        if not (os.path.exists('daily_sales_processed.parquet') or
+                os.path.exists('daily_sales_processed.csv')):
             # Create sample sales data
             dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='D')
             np.random.seed(42)
@@ -212,7 +213,8 @@ def main():
             sales_data.to_csv('daily_sales_processed.csv', index=False)
             logger.info("Created sample sales data")
         
-        if not os.path.exists('forecast_data.csv'):
+        if not (os.path.exists('forecast_data.parquet') or
+                os.path.exists('forecast_data.csv')):
             # Create sample forecast data
             future_dates = pd.date_range(start='2025-01-01', end='2025-12-31', freq='D')
             
@@ -226,9 +228,17 @@ def main():
             forecast_data.to_csv('forecast_data.csv', index=False)
             logger.info("Created sample forecast data")
         
-        # Load data
-        sales_data = pd.read_csv('daily_sales_processed.csv')
-        forecast_data = pd.read_csv('forecast_data.csv')
+        # Load data - the upstream scripts write Parquet now; the CSV
+        # paths cover older runs and the sample data above
+        if os.path.exists('daily_sales_processed.parquet'):
+            sales_data = (pd.read_parquet('daily_sales_processed.parquet')
+                          .rename_axis('date').reset_index())
+        else:
+            sales_data = pd.read_csv('daily_sales_processed.csv')
+        if os.path.exists('forecast_data.parquet'):
+            forecast_data = pd.read_parquet('forecast_data.parquet').reset_index()
+        else:
+            forecast_data = pd.read_csv('forecast_data.csv')
         
         # Create visualizer
         visualizer = BusinessVisualizer(sales_data, forecast_data)
@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -12,13 +13,23 @@ def load_forecast_data():
     Load forecast data from the prediction files
     """
     try:
-        # Load historical data
-        historical_data = pd.read_csv('daily_sales_processed.csv')
-        historical_data['date'] = pd.to_datetime(historical_data.iloc[:, 0])
-        historical_data.set_index('date', inplace=True)
+        # Load historical data - time_series_analysis writes Parquet by
+        # default now (CSV only behind its --csv flag), which keeps the
+        # DatetimeIndex so no reparsing is needed
+        if os.path.exists('daily_sales_processed.parquet'):
+            historical_data = pd.read_parquet('daily_sales_processed.parquet')
+            historical_data = historical_data.rename_axis('date')
+        else:
+            historical_data = pd.read_csv('daily_sales_processed.csv')
+            historical_data['date'] = pd.to_datetime(historical_data.iloc[:, 0])
+            historical_data.set_index('date', inplace=True)
         
-        # Load forecast data
-        forecast_data = pd.read_csv('forecast_data.csv', parse_dates=['date'], index_col='date')
+        # Load forecast data - sales_forecasting now writes Parquet; keep
+        # the CSV path for forecasts produced by older runs
+        if os.path.exists('forecast_data.parquet'):
+            forecast_data = pd.read_parquet('forecast_data.parquet')
+        else:
+            forecast_data = pd.read_csv('forecast_data.csv', parse_dates=['date'], index_col='date')
         
         return historical_data, forecast_data
     except Exception as e: